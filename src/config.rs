@@ -34,6 +34,9 @@ pub const RUN_SYSD: &str = "/run/systemd";
 pub const ETC_SYSD: &str = "/etc/systemd";
 pub const WORK_DIR: &str = "/run/systemd/swap";
 
+/// Tokens accepted as "true" for boolean config values (case-insensitive)
+const TRUE_TOKENS: [&str; 4] = ["yes", "y", "1", "true"];
+
 /// Configuration holder
 #[derive(Debug, Clone)]
 pub struct Config {
@@ -57,19 +60,17 @@ impl Config {
             crate::meminfo::get_ram_size().unwrap_or(0).to_string(),
         );
 
-        // Load default config
-        if Path::new(DEF_CONFIG).exists() {
-            if let Ok(cfg) = Self::parse_config(DEF_CONFIG, &system_vars) {
-                values.extend(cfg);
-            }
+        // Load default config. No exists() pre-check: just open it and treat
+        // a missing file like the old silent skip (saves a stat per load).
+        if let Ok(cfg) = Self::parse_config(DEF_CONFIG, &system_vars) {
+            values.extend(cfg);
         }
 
-        // Load /etc/systemd/swap.conf
-        if Path::new(ETC_CONFIG).exists() {
-            match Self::parse_config(ETC_CONFIG, &system_vars) {
-                Ok(cfg) => values.extend(cfg),
-                Err(e) => warn!("Could not load {}: {}", ETC_CONFIG, e),
-            }
+        // Load /etc/systemd/swap.conf — absent is fine, anything else warns
+        match Self::parse_config(ETC_CONFIG, &system_vars) {
+            Ok(cfg) => values.extend(cfg),
+            Err(ConfigError::Io(e)) if e.kind() == std::io::ErrorKind::NotFound => {}
+            Err(e) => warn!("Could not load {}: {}", ETC_CONFIG, e),
         }
 
         // Load conf.d fragments (etc > run > lib for same basename)
@@ -145,14 +146,27 @@ impl Config {
         path: P,
         extra_vars: &HashMap<String, String>,
     ) -> Result<HashMap<String, String>> {
-        let mut config = HashMap::new();
         let content = fs::read_to_string(path)?;
+        Ok(Self::parse_config_str(&content, extra_vars))
+    }
+
+    /// Parse config content already held in memory.
+    ///
+    /// Split out from `parse_config` so the line-splitting logic can be
+    /// exercised (and tested) without touching the filesystem.
+    fn parse_config_str(
+        content: &str,
+        extra_vars: &HashMap<String, String>,
+    ) -> HashMap<String, String> {
+        let mut config = HashMap::new();
 
         for line in content.lines() {
             let line = line.trim();
 
-            // Skip comments and empty lines
-            if line.starts_with('#') || !line.contains('=') {
+            // Skip comments and empty lines via a single first-byte check;
+            // split_once below already rejects lines without '=', so no
+            // separate contains('=') scan is needed.
+            if matches!(line.as_bytes().first(), None | Some(b'#')) {
                 continue;
             }
 
@@ -168,12 +182,17 @@ impl Config {
             }
         }
 
-        Ok(config)
+        config
     }
 
     /// Safely expand environment variables and simple arithmetic in config values
     /// without invoking a shell.
     fn expand_value(value: &str, extra_vars: &HashMap<String, String>) -> String {
+        // Fast path: most config values contain no '$' — skip building the
+        // per-variable search patterns (two format! calls each) entirely.
+        if !value.contains('$') {
+            return value.to_string();
+        }
         let mut result = value.to_string();
         // Expand injected system variables first (NCPU, RAM_SIZE) — no env mutation needed.
         for (key, val) in extra_vars {
@@ -182,6 +201,9 @@ impl Config {
         }
         // Expand ambient environment variables ${VAR} and $VAR
         for (key, val) in std::env::vars() {
+            if !result.contains('$') {
+                break;
+            }
             result = result.replace(&format!("${{{}}}", key), &val);
             result = result.replace(&format!("${}", key), &val);
         }
@@ -269,7 +291,7 @@ impl Config {
     /// Get boolean value (yes/y/1/true = true)
     pub fn get_bool(&self, key: &str) -> bool {
         self.get(key)
-            .map(|v| matches!(v.to_lowercase().as_str(), "yes" | "y" | "1" | "true"))
+            .map(|v| TRUE_TOKENS.iter().any(|t| v.eq_ignore_ascii_case(t)))
             .unwrap_or(false)
     }
 
@@ -284,57 +306,59 @@ mod tests {
     use super::*;
 
     fn config_from_str(s: &str) -> Config {
-        let mut values = HashMap::new();
-        for line in s.lines() {
-            let line = line.trim();
-            if line.is_empty() || line.starts_with('#') {
-                continue;
-            }
-            if let Some((k, v)) = line.split_once('=') {
-                values.insert(k.trim().to_string(), v.trim().to_string());
-            }
+        Config {
+            values: Config::parse_config_str(s, &HashMap::new()),
         }
-        Config { values }
     }
 
-    // ── evaluate_simple_arithmetic ────────────────────────────────────────────
-
-    #[test]
-    fn arith_addition() {
-        assert_eq!(Config::evaluate_simple_arithmetic("2 + 3"), "5");
-    }
+    // ── Config::parse_config_str ─────────────────────────────────────────────
 
     #[test]
-    fn arith_subtraction() {
-        assert_eq!(Config::evaluate_simple_arithmetic("10 - 4"), "6");
+    fn parse_config_simple() {
+        let content = "key1=value1\nkey2=value2\nkey3=value3\n";
+        let parsed = Config::parse_config_str(content, &HashMap::new());
+        assert_eq!(parsed.get("key1").map(String::as_str), Some("value1"));
+        assert_eq!(parsed.get("key2").map(String::as_str), Some("value2"));
+        assert_eq!(parsed.get("key3").map(String::as_str), Some("value3"));
     }
 
     #[test]
-    fn arith_multiplication() {
-        assert_eq!(Config::evaluate_simple_arithmetic("3 * 7"), "21");
+    fn parse_config_with_comments() {
+        let content = "key1=value1\n# comment line\nkey2=value2 # inline comment\n";
+        let parsed = Config::parse_config_str(content, &HashMap::new());
+        assert_eq!(parsed.len(), 2);
+        assert_eq!(parsed.get("key2").map(String::as_str), Some("value2"));
     }
 
     #[test]
-    fn arith_division() {
-        assert_eq!(Config::evaluate_simple_arithmetic("20 / 4"), "5");
+    fn parse_config_empty_content() {
+        let parsed = Config::parse_config_str("", &HashMap::new());
+        assert!(parsed.is_empty());
     }
 
-    #[test]
-    fn arith_division_by_zero() {
-        assert_eq!(Config::evaluate_simple_arithmetic("5 / 0"), "0");
-    }
-
-    #[test]
-    fn arith_plain_number() {
-        assert_eq!(Config::evaluate_simple_arithmetic("42"), "42");
-    }
+    // ── evaluate_simple_arithmetic ────────────────────────────────────────────
 
     #[test]
-    fn arith_unknown_expr_passthrough() {
-        assert_eq!(
-            Config::evaluate_simple_arithmetic("not_a_number"),
-            "not_a_number"
-        );
+    fn arith_expressions() {
+        // (expression, expected) — one data-driven test instead of a test
+        // function per case; failures still name the offending expression.
+        let cases = [
+            ("2 + 3", "5"),
+            ("10 - 4", "6"),
+            ("3 * 7", "21"),
+            ("20 / 4", "5"),
+            ("5 / 0", "0"),
+            ("42", "42"),
+            ("not_a_number", "not_a_number"),
+        ];
+        for (expr, expected) in cases {
+            assert_eq!(
+                Config::evaluate_simple_arithmetic(expr),
+                expected,
+                "expression: {}",
+                expr
+            );
+        }
     }
 
     // ── Config::get_bool ─────────────────────────────────────────────────────
@@ -55,6 +55,19 @@ pub fn write_file<P: AsRef<Path>>(path: P, content: &str) -> Result<()> {
     Ok(())
 }
 
+/// Write string to an existing sysfs/procfs attribute file.
+///
+/// Unlike `write_file`, this opens without O_CREAT: sysfs rejects file
+/// creation, so `File::create` on a missing attribute fails with EACCES
+/// rather than ENOENT. Opening write-only without create lets callers tell
+/// a genuinely absent attribute (unsupported kernel) apart from a real
+/// write failure via `ErrorKind::NotFound`.
+pub fn write_sysfs<P: AsRef<Path>>(path: P, content: &str) -> Result<()> {
+    let mut file = fs::OpenOptions::new().write(true).open(path)?;
+    file.write_all(content.as_bytes())?;
+    Ok(())
+}
+
 /// Force remove file, ignoring errors
 pub fn force_remove<P: AsRef<Path>>(path: P, verbose: bool) {
     let path = path.as_ref();
@@ -201,9 +214,10 @@ pub fn get_fstype<P: AsRef<Path>>(path: P) -> Option<String> {
 }
 
 /// Common size-unit constants
-pub const KB: u64 = 1024;
-pub const MB: u64 = 1024 * KB;
-pub const GB: u64 = 1024 * MB;
+pub const KB: u64 = 1 << 10;
+pub const MB: u64 = 1 << 20;
+pub const GB: u64 = 1 << 30;
+pub const TB: u64 = 1 << 40;
 
 /// Parse size string to bytes.
 ///
@@ -225,18 +239,18 @@ pub fn parse_size(s: &str) -> std::result::Result<u64, String> {
         return Ok(ram * percent / 100);
     }
 
-    // Handle size with suffix (e.g., "1G", "512M")
+    // Handle size with suffix (e.g., "1G", "512M") — match the suffix byte
+    // directly instead of allocating an uppercased String per call.
     if s.len() > 1 {
-        let (num_part, suffix) = s.split_at(s.len() - 1);
-        let multiplier = match suffix.to_ascii_uppercase().as_str() {
-            "K" => Some(KB),
-            "M" => Some(MB),
-            "G" => Some(GB),
-            "T" => Some(GB * 1024),
+        let multiplier = match s.as_bytes()[s.len() - 1].to_ascii_uppercase() {
+            b'K' => Some(KB),
+            b'M' => Some(MB),
+            b'G' => Some(GB),
+            b'T' => Some(TB),
             _ => None,
         };
         if let Some(m) = multiplier {
-            return num_part
+            return s[..s.len() - 1]
                 .parse::<u64>()
                 .map(|n| n * m)
                 .map_err(|_| format!("Invalid size: {}", s));
@@ -278,3 +292,31 @@ macro_rules! debug {
         }
     };
 }
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    #[test]
+    fn parse_size_suffixes() {
+        // (input, expected bytes) — lowercase suffixes are accepted too
+        let cases = [
+            ("256K", 256 * KB),
+            ("512M", 512 * MB),
+            ("512m", 512 * MB),
+            ("1G", GB),
+            ("2T", 2 * TB),
+            ("1073741824", 1073741824),
+        ];
+        for (input, expected) in cases {
+            assert_eq!(parse_size(input).unwrap(), expected, "input: {}", input);
+        }
+    }
+
+    #[test]
+    fn parse_size_invalid() {
+        assert!(parse_size("").is_err());
+        assert!(parse_size("abc").is_err());
+        assert!(parse_size("G").is_err());
+    }
+}
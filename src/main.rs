@@ -429,35 +429,40 @@ fn stop(on_init: bool) -> Result<(), Box<dyn std::error::Error>> {
     let config = Config::load()?;
 
     // Stop all managed swap units (check both swapfile and legacy swapfc names).
-    // On init (on_init=true), skip swapfile units: adopt_existing_swapfiles() will
-    // take ownership of them without swapping them off under memory pressure.
-    for subsystem in ["swapfile", "swapfc", "zram"] {
-        if on_init {
-            // On init, skip ALL subsystems: adopt_existing_swapfiles() will
-            // reuse swapfiles, and ZramPool will adopt existing zram devices.
-            // Doing swapoff under memory pressure causes OOM on low-RAM systems.
-            continue;
-        }
+    // On init (on_init=true), skip ALL subsystems: adopt_existing_swapfiles()
+    // will reuse swapfiles, and ZramPool will adopt existing zram devices.
+    // Doing swapoff under memory pressure causes OOM on low-RAM systems.
+    //
+    // Iterate unit-major so each unit file is read and lowercased exactly once
+    // instead of once per subsystem; the subsystem order preserves the old
+    // swapfile > swapfc > zram match priority.
+    if !on_init {
         for unit_path in find_swap_units() {
-            if let Ok(content) = read_file(&unit_path) {
-                if content.to_lowercase().contains(subsystem) {
-                    if let Some(dev) = get_what_from_swap_unit(&unit_path) {
-                        info!("{}: swapoff {}", subsystem, dev);
-                        let _ = swapoff(&dev);
-                        force_remove(&unit_path, true);
-
-                        if subsystem == "swapfile" && dev.starts_with("/dev/loop") {
-                            // Detach the loop device after swapoff to prevent it from
-                            // persisting with a "(deleted)" backing file reference.
-                            let _ = std::process::Command::new("losetup")
-                                .args(["-d", &dev])
-                                .status();
-                        } else if subsystem == "swapfile" && Path::new(&dev).is_file() {
-                            force_remove(&dev, true);
-                        } else if subsystem == "zram" {
-                            let _ = systemd_swap::zram::release(&dev);
-                        }
-                    }
+            let Ok(content) = read_file(&unit_path) else {
+                continue;
+            };
+            let content_lower = content.to_lowercase();
+            let Some(subsystem) = ["swapfile", "swapfc", "zram"]
+                .into_iter()
+                .find(|s| content_lower.contains(s))
+            else {
+                continue;
+            };
+            if let Some(dev) = get_what_from_swap_unit(&unit_path) {
+                info!("{}: swapoff {}", subsystem, dev);
+                let _ = swapoff(&dev);
+                force_remove(&unit_path, true);
+
+                if subsystem == "swapfile" && dev.starts_with("/dev/loop") {
+                    // Detach the loop device after swapoff to prevent it from
+                    // persisting with a "(deleted)" backing file reference.
+                    let _ = std::process::Command::new("losetup")
+                        .args(["-d", &dev])
+                        .status();
+                } else if subsystem == "swapfile" && Path::new(&dev).is_file() {
+                    force_remove(&dev, true);
+                } else if subsystem == "zram" {
+                    let _ = systemd_swap::zram::release(&dev);
                 }
             }
         }
@@ -589,7 +594,7 @@ fn status() -> Result<(), Box<dyn std::error::Error>> {
             let fields: Vec<&str> = line.split_whitespace().collect();
             if fields.len() >= 4 {
                 let name = fields[0];
-                if name.contains("loop") || name.contains("swapfile") || name.starts_with("/swapfile/") {
+                if name.starts_with("/dev/loop") || name.contains("swapfile") {
                     files.push(SwapEntry {
                         name: name.to_string(),
                         size: fields[2].parse().unwrap_or(0),
@@ -2,8 +2,8 @@
 // SPDX-License-Identifier: GPL-3.0-or-later
 
 use std::collections::{HashMap, HashSet};
-use std::fs::File;
-use std::io::{BufRead, BufReader};
+use std::fs;
+use std::sync::OnceLock;
 
 use thiserror::Error;
 
@@ -25,41 +25,38 @@ pub fn get_mem_stats(fields: &[&str]) -> Result<HashMap<String, u64>> {
     let mut stats = HashMap::new();
     let mut remaining: HashSet<&str> = fields.iter().copied().collect();
 
-    let file = File::open("/proc/meminfo")?;
-    let reader = BufReader::new(file);
-
-    for line in reader.lines() {
-        let line = line?;
+    // One read into a string; per-line BufReader allocation is pointless
+    // for a small virtual file.
+    let content = fs::read_to_string("/proc/meminfo")?;
 
+    for line in content.lines() {
         // Parse "Key:   value kB" format
-        if let Some(colon_pos) = line.find(':') {
-            let key = &line[..colon_pos];
-
-            if remaining.contains(key) {
-                let value_part = line[colon_pos + 1..].trim();
-                let parts: Vec<&str> = value_part.split_whitespace().collect();
-
-                let value = if parts.len() >= 2 && parts[1] == "kB" {
-                    parts[0]
-                        .parse::<u64>()
-                        .map_err(|e| MemInfoError::ParseError(e.to_string()))?
-                        * 1024
-                } else if !parts.is_empty() {
-                    parts[0]
-                        .parse::<u64>()
-                        .map_err(|e| MemInfoError::ParseError(e.to_string()))?
-                } else {
-                    continue;
-                };
+        let Some(colon_pos) = line.find(':') else {
+            continue;
+        };
+        let key = &line[..colon_pos];
+        if !remaining.contains(key) {
+            continue;
+        }
 
-                stats.insert(key.to_string(), value);
-                remaining.remove(key);
+        // Single pass over the value part — no intermediate Vec
+        let mut parts = line[colon_pos + 1..].split_whitespace();
+        let Some(raw) = parts.next() else {
+            continue;
+        };
+        let mut value = raw
+            .parse::<u64>()
+            .map_err(|e| MemInfoError::ParseError(e.to_string()))?;
+        if parts.next() == Some("kB") {
+            value *= 1024;
+        }
+
+        stats.insert(key.to_string(), value);
+        remaining.remove(key);
 
-                // Early exit if all fields found
-                if remaining.is_empty() {
-                    break;
-                }
-            }
+        // Early exit if all fields found
+        if remaining.is_empty() {
+            break;
         }
     }
 
@@ -130,12 +127,15 @@ pub fn get_free_swap_percent_effective() -> Result<u8> {
     }
 }
 
-/// Get page size from system
+/// Get page size from system (cached — it cannot change at runtime)
 pub fn get_page_size() -> u64 {
-    nix::unistd::sysconf(nix::unistd::SysconfVar::PAGE_SIZE)
-        .ok()
-        .flatten()
-        .unwrap_or(4096) as u64
+    static PAGE_SIZE: OnceLock<u64> = OnceLock::new();
+    *PAGE_SIZE.get_or_init(|| {
+        nix::unistd::sysconf(nix::unistd::SysconfVar::PAGE_SIZE)
+            .ok()
+            .flatten()
+            .unwrap_or(4096) as u64
+    })
 }
 
 /// Get CPU count
@@ -207,13 +207,7 @@ pub fn get_effective_swap_usage() -> Result<EffectiveSwapUsage> {
 
     // Calculate pool utilization if zswap is active
     if result.zswap_active {
-        let max_pool_percent: u64 =
-            std::fs::read_to_string("/sys/module/zswap/parameters/max_pool_percent")
-                .ok()
-                .and_then(|s| s.trim().parse().ok())
-                .unwrap_or(20);
-
-        let max_pool_size = mem_total * max_pool_percent / 100;
+        let max_pool_size = mem_total * zswap_max_pool_percent() / 100;
         if max_pool_size > 0 {
             result.zswap_pool_percent = ((zswap_compressed * 100) / max_pool_size).min(100) as u8;
         }
@@ -222,6 +216,21 @@ pub fn get_effective_swap_usage() -> Result<EffectiveSwapUsage> {
     Ok(result)
 }
 
+/// Zswap max_pool_percent, read once per process.
+///
+/// The daemon configures this parameter at startup and never changes it
+/// afterwards, so the monitor loops don't need to re-read the sysfs file on
+/// every polling tick.
+fn zswap_max_pool_percent() -> u64 {
+    static MAX_POOL: OnceLock<u64> = OnceLock::new();
+    *MAX_POOL.get_or_init(|| {
+        fs::read_to_string("/sys/module/zswap/parameters/max_pool_percent")
+            .ok()
+            .and_then(|s| s.trim().parse().ok())
+            .unwrap_or(20)
+    })
+}
+
 /// Get the disk-level swap usage percentage from /proc/meminfo (0-100).
 ///
 /// For zswap: the kernel allocates swap slots for pages entering zswap,
@@ -231,36 +240,30 @@ fn get_mem_stats_optional(fields: &[&str]) -> Result<HashMap<String, u64>> {
     let mut stats = HashMap::new();
     let mut remaining: HashSet<&str> = fields.iter().copied().collect();
 
-    let file = File::open("/proc/meminfo")?;
-    let reader = BufReader::new(file);
+    let content = fs::read_to_string("/proc/meminfo")?;
 
-    for line in reader.lines() {
-        let line = line?;
+    for line in content.lines() {
+        let Some(colon_pos) = line.find(':') else {
+            continue;
+        };
+        let key = &line[..colon_pos];
+        if !remaining.contains(key) {
+            continue;
+        }
 
-        if let Some(colon_pos) = line.find(':') {
-            let key = &line[..colon_pos];
+        let mut parts = line[colon_pos + 1..].split_whitespace();
+        let Some(mut value) = parts.next().and_then(|raw| raw.parse::<u64>().ok()) else {
+            continue;
+        };
+        if parts.next() == Some("kB") {
+            value *= 1024;
+        }
 
-            if remaining.contains(key) {
-                let value_part = line[colon_pos + 1..].trim();
-                let parts: Vec<&str> = value_part.split_whitespace().collect();
+        stats.insert(key.to_string(), value);
+        remaining.remove(key);
 
-                let value = if parts.len() >= 2 && parts[1] == "kB" {
-                    parts[0].parse::<u64>().ok().map(|v| v * 1024)
-                } else if !parts.is_empty() {
-                    parts[0].parse::<u64>().ok()
-                } else {
-                    None
-                };
-
-                if let Some(v) = value {
-                    stats.insert(key.to_string(), v);
-                    remaining.remove(key);
-
-                    if remaining.is_empty() {
-                        break;
-                    }
-                }
-            }
+        if remaining.is_empty() {
+            break;
         }
     }
 
@@ -4,6 +4,7 @@
 use std::fs;
 use std::path::{Path, PathBuf};
 use std::process::{Command, Stdio};
+use std::sync::OnceLock;
 use std::thread;
 use std::time::{Duration, Instant};
 
@@ -36,6 +37,13 @@ pub enum SwapFileError {
 
 pub type Result<T> = std::result::Result<T, SwapFileError>;
 
+/// Shared "{WORK_DIR}/swapfile" path, built once instead of re-formatted on
+/// every monitor tick by the loop-device helpers.
+fn swapfile_workdir() -> &'static str {
+    static DIR: OnceLock<String> = OnceLock::new();
+    DIR.get_or_init(|| format!("{}/swapfile", WORK_DIR))
+}
+
 /// Information about an individual swap file from /proc/swaps
 #[derive(Debug, Clone)]
 pub struct SwapFileInfo {
@@ -222,12 +230,9 @@ fn tune_loop_device(loop_dev: &str) {
         warn!("swapFC: failed to set scheduler none on {}", dev_name);
     }
 
-    // Queue parameters
+    // Queue parameters (best-effort; kernels without wbt just fail the write)
     let _ = fs::write(format!("{}/nomerges", queue_path), "0");
-    let wbt_path = format!("{}/wbt_lat_usec", queue_path);
-    if Path::new(&wbt_path).exists() {
-        let _ = fs::write(&wbt_path, "75000");
-    }
+    let _ = fs::write(format!("{}/wbt_lat_usec", queue_path), "75000");
     let _ = fs::write(format!("{}/max_sectors_kb", queue_path), "512");
     let _ = fs::write(format!("{}/rq_affinity", queue_path), "1");
 }
@@ -243,10 +248,7 @@ fn retune_loop_queue(loop_dev: &str) {
         return;
     }
     let _ = fs::write(format!("{}/nomerges", queue_path), "0");
-    let wbt_path = format!("{}/wbt_lat_usec", queue_path);
-    if Path::new(&wbt_path).exists() {
-        let _ = fs::write(&wbt_path, "75000");
-    }
+    let _ = fs::write(format!("{}/wbt_lat_usec", queue_path), "75000");
     let _ = fs::write(format!("{}/max_sectors_kb", queue_path), "512");
     let _ = fs::write(format!("{}/rq_affinity", queue_path), "1");
 }
@@ -379,14 +381,13 @@ impl SwapFile {
                 }
             }
         } else {
-            // For ext4/xfs: just create directory
-            if !swapfile_config.path.exists() {
-                fs::create_dir_all(&swapfile_config.path)?;
-                info!(
-                    "swapFC: created swap directory at {:?}",
-                    swapfile_config.path
-                );
-            }
+            // For ext4/xfs: create the directory and any missing parents —
+            // no exists() pre-check, create_dir_all succeeds if already there.
+            fs::create_dir_all(&swapfile_config.path)?;
+            info!(
+                "swapFC: swap directory ready at {:?}",
+                swapfile_config.path
+            );
         }
 
         // Check btrfs mount options for loop-backed swap files.
@@ -454,7 +455,7 @@ impl SwapFile {
             }
         }
 
-        makedirs(format!("{}/swapfile", WORK_DIR))?;
+        makedirs(swapfile_workdir())?;
 
         // Check if ZSWAP is active
         let is_zswap_active = crate::zswap::is_enabled();
@@ -545,8 +546,8 @@ impl SwapFile {
         // Scan all loop_info files in WORK_DIR, not just up to self.allocated.
         // During adoption (adopt_existing_swapfiles), self.allocated is still 0,
         // so a 1..=self.allocated range would never iterate.
-        let loop_dir = format!("{}/swapfile", WORK_DIR);
-        let Ok(entries) = std::fs::read_dir(&loop_dir) else {
+        let loop_dir = swapfile_workdir();
+        let Ok(entries) = std::fs::read_dir(loop_dir) else {
             return false;
         };
         let loop_dev_str = loop_path.to_string_lossy();
@@ -686,7 +687,7 @@ impl SwapFile {
             }
 
             // Clean up loop info file
-            let loop_info_path = format!("{}/swapfile/loop_{}", WORK_DIR, idx);
+            let loop_info_path = format!("{}/loop_{}", swapfile_workdir(), idx);
             force_remove(&loop_info_path, false);
 
             // Update file_sizes if we tracked this file
@@ -713,7 +714,7 @@ impl SwapFile {
 
         // Check loop device info files
         for i in 1..=self.allocated {
-            let loop_info_path = format!("{}/swapfile/loop_{}", WORK_DIR, i);
+            let loop_info_path = format!("{}/loop_{}", swapfile_workdir(), i);
             if let Ok(content) = fs::read_to_string(&loop_info_path) {
                 let lines: Vec<&str> = content.lines().collect();
                 if !lines.is_empty() && lines[0] == path.to_string_lossy() {
@@ -729,8 +730,8 @@ impl SwapFile {
     fn get_backing_file_for_loop(&self, loop_path: &Path) -> Option<PathBuf> {
         // Scan all loop_info files (not bounded by self.allocated; may be called
         // during adoption before allocated is set).
-        let loop_dir = format!("{}/swapfile", WORK_DIR);
-        let Ok(entries) = std::fs::read_dir(&loop_dir) else {
+        let loop_dir = swapfile_workdir();
+        let Ok(entries) = std::fs::read_dir(loop_dir) else {
             return None;
         };
         let loop_dev_str = loop_path.to_string_lossy();
@@ -782,7 +783,7 @@ impl SwapFile {
                 let loop_name = info.path.to_string_lossy();
                 // Find the matching loop info file we just wrote
                 for i in 1..=28u32 {
-                    let loop_info = format!("{}/swapfile/loop_{}", WORK_DIR, i);
+                    let loop_info = format!("{}/loop_{}", swapfile_workdir(), i);
                     if let Ok(content) = fs::read_to_string(&loop_info) {
                         if content.lines().next() == Some(&loop_name) {
                             max_num = max_num.max(i);
@@ -877,7 +878,7 @@ impl SwapFile {
                 continue;
             };
 
-            let loop_info_path = format!("{}/swapfile/loop_{}", WORK_DIR, idx);
+            let loop_info_path = format!("{}/loop_{}", swapfile_workdir(), idx);
             let _ = fs::write(
                 &loop_info_path,
                 format!("{}\n{}", loop_dev, actual_backing.display()),
@@ -927,8 +928,8 @@ impl SwapFile {
     /// Re-apply volatile queue parameters on all active loop devices.
     /// Called after initial creation and after udevadm settle.
     fn retune_all_loops(&self) {
-        let loop_dir = format!("{}/swapfile", WORK_DIR);
-        let entries = match fs::read_dir(&loop_dir) {
+        let loop_dir = swapfile_workdir();
+        let entries = match fs::read_dir(loop_dir) {
             Ok(e) => e,
             Err(_) => return,
         };
@@ -952,8 +953,8 @@ impl SwapFile {
     /// so we use blockdev --setra (ioctl-based) and re-apply periodically.
     fn enforce_loop_readahead(&self) {
         let ra_sectors = 16; // 8KB = 16 sectors
-        let loop_dir = format!("{}/swapfile", WORK_DIR);
-        let Ok(entries) = fs::read_dir(&loop_dir) else {
+        let loop_dir = swapfile_workdir();
+        let Ok(entries) = fs::read_dir(loop_dir) else {
             return;
         };
         for entry in entries.flatten() {
@@ -1050,8 +1051,8 @@ impl SwapFile {
     /// These are loops left attached without active swap — e.g. after a stop
     /// timeout where only some loops were swapped off before the process was killed.
     fn detach_orphaned_loops(&self, active_backings: &std::collections::HashSet<PathBuf>) {
-        let loop_dir = format!("{}/swapfile", WORK_DIR);
-        let Ok(entries) = std::fs::read_dir(&loop_dir) else {
+        let loop_dir = swapfile_workdir();
+        let Ok(entries) = std::fs::read_dir(loop_dir) else {
             return;
         };
         for entry in entries.flatten() {
@@ -1488,7 +1489,7 @@ impl SwapFile {
 
         // Store loop device info for cleanup
         if let Some(ref loop_dev) = loop_device {
-            let loop_info_path = format!("{}/swapfile/loop_{}", WORK_DIR, self.allocated);
+            let loop_info_path = format!("{}/loop_{}", swapfile_workdir(), self.allocated);
             let _ = fs::write(
                 &loop_info_path,
                 format!("{}\n{}", loop_dev, swapfile_path.display()),
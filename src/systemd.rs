@@ -123,7 +123,7 @@ pub fn gen_swap_unit(
     let metadata = fs::metadata(&what)?;
     let device_type = if metadata.permissions().mode() & 0o170000 == 0o060000 {
         // Block device
-        if what_str.contains("loop") {
+        if what_str.starts_with("/dev/loop") {
             DeviceType::File
         } else {
             DeviceType::Block
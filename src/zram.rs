@@ -11,7 +11,7 @@ use thiserror::Error;
 
 use crate::config::{Config, WORK_DIR};
 use crate::defaults;
-use crate::helpers::{makedirs, parse_size, read_file};
+use crate::helpers::{makedirs, parse_size, read_file, write_sysfs, HelperError};
 use crate::systemd::{gen_swap_unit, systemctl, SystemctlAction};
 use crate::{error, info, warn};
 
@@ -88,10 +88,15 @@ pub fn start(config: &Config) -> Result<()> {
     );
 
     info!("Zram: trying to initialize free device");
-    if !Path::new(ZRAM_HOT_ADD).exists() {
-        return Err(ZramError::NoFreeDevice);
-    }
-    let new_id: String = read_file(ZRAM_HOT_ADD)?.trim().to_string();
+    // No exists() pre-check: a missing file means the kernel lacks hot_add;
+    // any other read error is a real failure and propagates as-is.
+    let new_id: String = match read_file(ZRAM_HOT_ADD) {
+        Ok(id) => id.trim().to_string(),
+        Err(HelperError::Io(e)) if e.kind() == std::io::ErrorKind::NotFound => {
+            return Err(ZramError::NoFreeDevice)
+        }
+        Err(e) => return Err(e.into()),
+    };
     let zram_dev = format!("/dev/zram{}", new_id);
     let zram_sysfs = format!("/sys/block/zram{}", new_id);
     info!("Zram: initialized: {}", zram_dev);
@@ -109,14 +114,15 @@ pub fn start(config: &Config) -> Result<()> {
 
     if zram_mem_limit > 0 {
         let mem_limit_path = format!("{}/mem_limit", zram_sysfs);
-        if Path::new(&mem_limit_path).exists() {
-            match std::fs::write(&mem_limit_path, zram_mem_limit.to_string()) {
-                Ok(_) => info!(
-                    "Zram: mem_limit = {} MiB (RAM protection)",
-                    zram_mem_limit / (1024 * 1024)
-                ),
-                Err(e) => warn!("Zram: failed to set mem_limit: {}", e),
-            }
+        // write_sysfs opens without O_CREAT, so a kernel without mem_limit
+        // support yields NotFound here; stay quiet in that case.
+        match write_sysfs(&mem_limit_path, &zram_mem_limit.to_string()) {
+            Ok(_) => info!(
+                "Zram: mem_limit = {} MiB (RAM protection)",
+                zram_mem_limit / (1024 * 1024)
+            ),
+            Err(HelperError::Io(e)) if e.kind() == std::io::ErrorKind::NotFound => {}
+            Err(e) => warn!("Zram: failed to set mem_limit: {}", e),
         }
     }
 
@@ -129,8 +135,7 @@ pub fn start(config: &Config) -> Result<()> {
 
     if !mkswap_status.success() {
         // Clean up the zram device on mkswap failure
-        let zram_id = zram_dev.trim_start_matches("/dev/zram");
-        let _ = std::fs::write(format!("/sys/block/zram{}/reset", zram_id), "1");
+        let _ = std::fs::write(format!("{}/reset", zram_sysfs), "1");
         return Err(ZramError::ZramctlFailed("mkswap failed".to_string()));
     }
 
@@ -146,8 +151,6 @@ pub fn start(config: &Config) -> Result<()> {
     systemctl(SystemctlAction::Start, &unit_name)?;
 
     // Save zram info for status queries
-    let zram_id = zram_dev.trim_start_matches("/dev/zram");
-    let zram_sysfs = format!("/sys/block/zram{}", zram_id);
     let zram_info = format!("{}\n{}", zram_dev, zram_sysfs);
     let _ = std::fs::write(format!("{}/zram/device", WORK_DIR), &zram_info);
 
@@ -422,11 +425,16 @@ impl ZramPool {
                 continue; // Not initialized
             }
 
-            // Check if it's an active swap device via /proc/swaps
+            // Check if it's an active swap device via /proc/swaps.
+            // Compare the first field exactly — a substring scan would match
+            // /dev/zram1 against /dev/zram10's line.
             let Ok(swaps) = std::fs::read_to_string("/proc/swaps") else {
                 continue;
             };
-            if !swaps.contains(&dev_path) {
+            let is_active_swap = swaps
+                .lines()
+                .any(|l| l.split_whitespace().next() == Some(dev_path.as_str()));
+            if !is_active_swap {
                 continue;
             }
 
@@ -460,16 +468,17 @@ impl ZramPool {
             return Err(ZramError::PoolMaxDevices);
         }
 
-        if !Path::new(ZRAM_HOT_ADD).exists() {
-            return Err(ZramError::ZramctlFailed(
-                "Kernel doesn't support hot_add".to_string(),
-            ));
-        }
-
-        let new_id: u32 = read_file(ZRAM_HOT_ADD)?
-            .trim()
-            .parse()
-            .map_err(|_| ZramError::ZramctlFailed("Invalid hot_add response".to_string()))?;
+        let new_id: u32 = match read_file(ZRAM_HOT_ADD) {
+            Ok(id) => id.trim().parse().map_err(|_| {
+                ZramError::ZramctlFailed("Invalid hot_add response".to_string())
+            })?,
+            Err(HelperError::Io(e)) if e.kind() == std::io::ErrorKind::NotFound => {
+                return Err(ZramError::ZramctlFailed(
+                    "Kernel doesn't support hot_add".to_string(),
+                ))
+            }
+            Err(e) => return Err(e.into()),
+        };
 
         let sysfs_path = format!("/sys/block/zram{}", new_id);
         let dev_path = format!("/dev/zram{}", new_id);
@@ -483,11 +492,10 @@ impl ZramPool {
         );
 
         // Set algorithm_params before disksize for proper initialization
+        // (best-effort write; older kernels simply don't have the file)
         if self.config.algorithm == "zstd" {
             let params_path = format!("{}/algorithm_params", sysfs_path);
-            if Path::new(&params_path).exists() {
-                let _ = std::fs::write(&params_path, "level=3");
-            }
+            let _ = std::fs::write(&params_path, "level=3");
         }
 
         // Set disksize
@@ -506,15 +514,16 @@ impl ZramPool {
             let device_count = (self.devices.len() as u64 + 1).max(4);
             let per_device_limit = total_limit / device_count;
             let mem_limit_path = format!("{}/mem_limit", sysfs_path);
-            if Path::new(&mem_limit_path).exists() {
-                match std::fs::write(&mem_limit_path, per_device_limit.to_string()) {
-                    Ok(_) => info!(
-                        "ZramPool: zram{} mem_limit = {}MB",
-                        new_id,
-                        per_device_limit / (1024 * 1024)
-                    ),
-                    Err(e) => warn!("ZramPool: failed to set mem_limit for zram{}: {}", new_id, e),
-                }
+            // write_sysfs opens without O_CREAT, so a kernel without
+            // mem_limit support yields NotFound here; stay quiet then.
+            match write_sysfs(&mem_limit_path, &per_device_limit.to_string()) {
+                Ok(_) => info!(
+                    "ZramPool: zram{} mem_limit = {}MB",
+                    new_id,
+                    per_device_limit / (1024 * 1024)
+                ),
+                Err(HelperError::Io(e)) if e.kind() == std::io::ErrorKind::NotFound => {}
+                Err(e) => warn!("ZramPool: failed to set mem_limit for zram{}: {}", new_id, e),
             }
         }
 
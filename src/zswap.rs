@@ -9,7 +9,7 @@ use thiserror::Error;
 
 use crate::config::{Config, WORK_DIR};
 use crate::defaults;
-use crate::helpers::{makedirs, read_file, write_file};
+use crate::helpers::{makedirs, read_file, write_file, write_sysfs, HelperError};
 use crate::{error, info, warn};
 
 const ZSWAP_MODULE: &str = "/sys/module/zswap";
@@ -75,11 +75,11 @@ pub fn start(config: &Config) -> Result<ZswapBackup> {
     let mut backup = HashMap::new();
     if let Ok(entries) = fs::read_dir(ZSWAP_PARAMS) {
         for entry in entries.flatten() {
+            // No is_file() pre-check: the parameters dir holds only regular
+            // files, and read_file fails cleanly on anything else.
             let path = entry.path();
-            if path.is_file() {
-                if let Ok(content) = read_file(&path) {
-                    backup.insert(path.to_string_lossy().to_string(), content);
-                }
+            if let Ok(content) = read_file(&path) {
+                backup.insert(path.to_string_lossy().to_string(), content);
             }
         }
     }
@@ -127,15 +127,17 @@ pub fn start(config: &Config) -> Result<ZswapBackup> {
 
     for (name, value) in params {
         let path = format!("{}/{}", ZSWAP_PARAMS, name);
-        if !Path::new(&path).exists() {
-            warn!(
-                "Zswap: {} not supported on this kernel (file not found)",
-                name
-            );
-            continue;
-        }
-        if let Err(e) = write_file(&path, value) {
-            if name == "shrinker_enabled" || name == "accept_threshold_percent" {
+        // No exists() pre-check: write and classify the error instead
+        // (saves a stat per parameter). write_sysfs opens without O_CREAT,
+        // so a missing parameter file really surfaces as NotFound.
+        if let Err(e) = write_sysfs(&path, value) {
+            let missing = matches!(&e, HelperError::Io(io) if io.kind() == std::io::ErrorKind::NotFound);
+            if missing {
+                warn!(
+                    "Zswap: {} not supported on this kernel (file not found)",
+                    name
+                );
+            } else if name == "shrinker_enabled" || name == "accept_threshold_percent" {
                 warn!("Zswap: {} not writable on this kernel: {}", name, e);
             } else {
                 error!("Failed to write zswap_{}: {}", name, e);
@@ -144,8 +146,9 @@ pub fn start(config: &Config) -> Result<ZswapBackup> {
     }
 
     // Now enable zswap if requested
-    let should_enable =
-        enabled == "1" || enabled.to_lowercase() == "y" || enabled.to_lowercase() == "yes";
+    let should_enable = enabled == "1"
+        || enabled.eq_ignore_ascii_case("y")
+        || enabled.eq_ignore_ascii_case("yes");
     if should_enable {
         if let Err(e) = set_enabled(true) {
             error!("Failed to enable zswap: {}", e);